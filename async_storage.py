@@ -0,0 +1,134 @@
+"""
+asyncio front end for the storage layer
+
+On PostgreSQL, storage calls run on an asyncpg engine through
+AsyncSession.run_sync: the methods are the same synchronous code in
+storage.py, but their database I/O is awaited on the event loop instead of
+holding a threadpool thread for the whole request. Other databases (SQLite
+for local development), and PostgreSQL URLs that name another driver such
+as pg8000, keep running the sync methods in the threadpool.
+"""
+from typing import Callable, Optional, TypeVar
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
+
+from storage import (
+    DATABASE_URL, DATABASE_EXTERNAL_POOLER,
+    PG_POOL_SIZE, PG_MAX_OVERFLOW, PG_POOL_RECYCLE, QUERY_CACHE_SIZE, ASYNCPG_SOURCE_DRIVERS,
+    WorkBoardStorage, storage
+)
+
+T = TypeVar("T")
+
+# Server-side prepared statements kept per pooled asyncpg connection. Each
+# storage query always renders the same SQL text, so a repeated lookup skips
+# PostgreSQL's parse/plan step and only sends Bind/Execute.
+PREPARED_STATEMENT_CACHE_SIZE = 500
+
+
+# URL query parameters asyncpg.connect() accepts as they are
+ASYNCPG_QUERY_PARAMS = frozenset({
+    "host", "port", "ssl", "direct_tls", "passfile", "timeout", "command_timeout",
+    "prepared_statement_cache_size", "statement_cache_size",
+})
+
+
+def asyncpg_url(database_url: str) -> Optional[str]:
+    """
+    The asyncpg form of a psycopg2-style PostgreSQL URL, or None
+    
+    postgresql://u:p@/db?host=/cloudsql/project:region:instance&sslmode=require
+    becomes postgresql+asyncpg://u:p@/db?host=/cloudsql/project:region:instance&ssl=require.
+    URLs of other databases, or naming another driver (postgresql+pg8000://...),
+    give None and stay on the sync engine. Query parameters asyncpg does not
+    understand raise ValueError at startup rather than failing every request.
+    """
+    url = make_url(database_url)
+    if url.drivername not in ASYNCPG_SOURCE_DRIVERS:
+        return None
+    
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    unsupported = sorted(set(query) - ASYNCPG_QUERY_PARAMS)
+    if unsupported:
+        raise ValueError(
+            f"DATABASE_URL parameters not supported by asyncpg: {', '.join(unsupported)}"
+        )
+    return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(hide_password=False)
+
+
+class AsyncWorkBoardStorage:
+    """
+    Awaitable wrapper around a WorkBoardStorage.
+
+    Every run() call is one transaction: the storage method gets a dedicated
+    session, and the storage's before/after commit hooks (activity rows,
+    cache eviction) run exactly as they do in WorkBoardStorage.get_session.
+    """
+
+    def __init__(self, storage: WorkBoardStorage, database_url: str, external_pooler: bool = False):
+        self.storage = storage
+        self.engine: Optional[AsyncEngine] = None
+
+        async_url = asyncpg_url(database_url)
+        if async_url is None:
+            return
+        if external_pooler:
+            # Consecutive transactions may land on different server connections,
+            # where a cached statement does not exist; prepare every statement
+            # afresh under a name no other client can have taken
+            engine_options = {"poolclass": NullPool}
+            connect_args = {
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        else:
+            engine_options = {
+                "pool_size": PG_POOL_SIZE,
+                "max_overflow": PG_MAX_OVERFLOW,
+                "pool_pre_ping": True,
+                "pool_recycle": PG_POOL_RECYCLE,
+            }
+            connect_args = {"prepared_statement_cache_size": PREPARED_STATEMENT_CACHE_SIZE}
+        self.engine = create_async_engine(
+            async_url,
+            connect_args=connect_args,
+            query_cache_size=QUERY_CACHE_SIZE,
+            **engine_options
+        )
+        self.SessionLocal = async_sessionmaker(self.engine, autoflush=False, expire_on_commit=False)
+
+    async def run(self, method: Callable[..., T], *args, **kwargs) -> T:
+        """Call a storage method, e.g. run(storage.get_board, board_id)"""
+        if self.engine is None:
+            return await run_in_threadpool(method, *args, **kwargs)
+
+        async with self.SessionLocal() as session:
+            # Holds nothing but this call, so cached reads stay allowed
+            session.info["single_call"] = True
+            try:
+                result = await session.run_sync(
+                    lambda sync_session: method(*args, session=sync_session, **kwargs)
+                )
+                await session.run_sync(self.storage.before_commit)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        self.storage.after_commit(session.sync_session)
+        return result
+
+    async def dispose(self):
+        """Close the async engine's pooled connections"""
+        if self.engine is not None:
+            await self.engine.dispose()
+
+
+# Global async front end - asyncpg when DATABASE_URL is PostgreSQL
+async_storage = AsyncWorkBoardStorage(storage, DATABASE_URL, external_pooler=DATABASE_EXTERNAL_POOLER)
@@ -1,16 +1,136 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, SmallInteger, Text, ForeignKey, Index, CheckConstraint, BINARY
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
+import os
+import threading
 import enum
 
 
 Base = declarative_base()
 
 
+# Entropy for generate_uuid is drawn from the OS in blocks and sliced per id
+UUID_ENTROPY_BLOCK_SIZE = 4096
+_uuid_entropy = threading.local()
+
+
+def _reset_uuid_entropy():
+    # A forked worker must not replay the random bytes buffered by its parent
+    global _uuid_entropy
+    _uuid_entropy = threading.local()
+
+
+os.register_at_fork(after_in_child=_reset_uuid_entropy)
+
+
 def generate_uuid():
-    return str(uuid.uuid4())
+    """Random (version 4) UUID string, equivalent to str(uuid.uuid4())"""
+    state = _uuid_entropy
+    offset = getattr(state, "offset", UUID_ENTROPY_BLOCK_SIZE)
+    if offset + 16 > UUID_ENTROPY_BLOCK_SIZE:
+        state.block = os.urandom(UUID_ENTROPY_BLOCK_SIZE)
+        offset = 0
+    state.offset = offset + 16
+    
+    raw = bytearray(state.block[offset:offset + 16])
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+class UUIDBinary(TypeDecorator):
+    """
+    UUID stored as 16 raw bytes (native UUID column on PostgreSQL).
+    Python code and the API keep working with the hex-with-dashes string form.
+    """
+    impl = BINARY(16)
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=False))
+        return dialect.type_descriptor(BINARY(16))
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            raw = bytes.fromhex(value.replace("-", ""))
+        except (AttributeError, ValueError):
+            raw = b""
+        if len(raw) != 16:
+            # Malformed ids can never be stored, so bind them as NULL: lookups
+            # simply match nothing instead of failing
+            return None
+        if dialect.name == "postgresql":
+            return value
+        return raw
+    
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        h = value.hex()
+        return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+class utcnow(FunctionElement):
+    """Current UTC time, evaluated by the database"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    # Same text layout SQLAlchemy uses for DateTime on SQLite, with sub-second precision
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Enum stored as the member's declaration index in a SMALLINT column.
+    New members must be appended at the end of the enum so stored indexes keep their meaning.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = list(enum_class)
+        self._indexes = {member.value: index for index, member in enumerate(self._members)}
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self._indexes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {self.enum_class.__name__}") from None
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
+def _enum_range_check(column: str, enum_class) -> CheckConstraint:
+    """CHECK constraint keeping a SmallIntEnum column within its enum's indexes"""
+    return CheckConstraint(f"{column} BETWEEN 0 AND {len(enum_class) - 1}", name=f"ck_{column}_range")
 
 
 # Enums matching Pydantic models
@@ -46,68 +166,100 @@ class ActivityTypeEnum(str, enum.Enum):
 # SQLAlchemy ORM Models (Database)
 # ============================================
 
+# Models returned right after an INSERT/UPDATE load their server-generated
+# timestamps from RETURNING (eager_defaults) instead of a follow-up SELECT
+EAGER_DEFAULTS = {"eager_defaults": True}
+
+
 class Board(Base):
     __tablename__ = "boards"
+    __mapper_args__ = EAGER_DEFAULTS
     
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(UUIDBinary, primary_key=True, default=generate_uuid)
     name = Column(String(100), nullable=False, index=True)
     description = Column(String(500), nullable=True)
     color = Column(String(7), nullable=True)  # Hex color code
-    owner_id = Column(String, nullable=False, index=True)
+    owner_id = Column(String, nullable=False)
     is_archived = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
-    lists = relationship("List", back_populates="board", cascade="all, delete-orphan")
-    activities = relationship("ActivityLog", back_populates="board", cascade="all, delete-orphan")
+    lists = relationship("List", back_populates="board", cascade="all, delete-orphan", passive_deletes=True, order_by="List.position")
+    activities = relationship("ActivityLog", back_populates="board", cascade="all, delete-orphan", passive_deletes=True)
+    
+    # An owner's active boards, most recently updated first
+    __table_args__ = (
+        Index("ix_boards_owner_arch_updated", owner_id, is_archived, updated_at.desc()),
+    )
 
 
 class List(Base):
     __tablename__ = "lists"
+    __mapper_args__ = EAGER_DEFAULTS
     
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(UUIDBinary, primary_key=True, default=generate_uuid)
     name = Column(String(100), nullable=False)
     position = Column(Integer, default=0, nullable=False)
-    board_id = Column(String, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False, index=True)
+    board_id = Column(UUIDBinary, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
     is_archived = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
     board = relationship("Board", back_populates="lists")
-    cards = relationship("Card", back_populates="list", cascade="all, delete-orphan")
+    cards = relationship("Card", back_populates="list", cascade="all, delete-orphan", passive_deletes=True, order_by="Card.position")
+    
+    # Serve the board's lists filtered by archive state, already in position
+    # order, and the MAX(position) lookup when appending a list
+    __table_args__ = (
+        Index("ix_lists_board_arch_pos", board_id, is_archived, position),
+        Index("ix_lists_board_pos", board_id, position),
+    )
 
 
 class Card(Base):
     __tablename__ = "cards"
+    __mapper_args__ = EAGER_DEFAULTS
     
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(UUIDBinary, primary_key=True, default=generate_uuid)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    priority = Column(SQLEnum(CardPriorityEnum), default=CardPriorityEnum.MEDIUM, nullable=False)
-    status = Column(SQLEnum(CardStatusEnum), default=CardStatusEnum.TODO, nullable=False)
+    priority = Column(SmallIntEnum(CardPriorityEnum), default=CardPriorityEnum.MEDIUM, nullable=False)
+    status = Column(SmallIntEnum(CardStatusEnum), default=CardStatusEnum.TODO, nullable=False)
     position = Column(Integer, default=0, nullable=False)
     due_date = Column(DateTime, nullable=True)
-    list_id = Column(String, ForeignKey("lists.id", ondelete="CASCADE"), nullable=False, index=True)
-    assigned_to = Column(String, nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    list_id = Column(UUIDBinary, ForeignKey("lists.id", ondelete="CASCADE"), nullable=False)
+    # Copy of the list's board_id (lists never change board), kept so activity
+    # logging on card and comment writes needs no lookup of the parent list
+    board_id = Column(UUIDBinary, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False, index=True)
+    assigned_to = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
     list = relationship("List", back_populates="cards")
-    comments = relationship("Comment", back_populates="card", cascade="all, delete-orphan")
+    comments = relationship("Comment", back_populates="card", cascade="all, delete-orphan", passive_deletes=True)
+    
+    # A list's cards in position order, and a user's cards by due date
+    __table_args__ = (
+        Index("ix_cards_list_pos", list_id, position, id),
+        Index("ix_cards_assigned_due", assigned_to, due_date, created_at),
+        _enum_range_check("priority", CardPriorityEnum),
+        _enum_range_check("status", CardStatusEnum),
+    )
 
 
 class Comment(Base):
     __tablename__ = "comments"
+    __mapper_args__ = EAGER_DEFAULTS
     
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(UUIDBinary, primary_key=True, default=generate_uuid)
     content = Column(String(1000), nullable=False)
-    card_id = Column(String, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False, index=True)
+    card_id = Column(UUIDBinary, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(String, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     
     # Relationships
     card = relationship("Card", back_populates="comments")
@@ -116,12 +268,18 @@ class Comment(Base):
 class ActivityLog(Base):
     __tablename__ = "activity_logs"
     
-    id = Column(String, primary_key=True, default=generate_uuid)
-    board_id = Column(String, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUIDBinary, primary_key=True, default=generate_uuid)
+    board_id = Column(UUIDBinary, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(String, nullable=False, index=True)
-    activity_type = Column(SQLEnum(ActivityTypeEnum), nullable=False)
+    activity_type = Column(SmallIntEnum(ActivityTypeEnum), nullable=False)
     description = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
     
     # Relationships
     board = relationship("Board", back_populates="activities")
+    
+    # Keyset pagination walks (created_at, id) backwards within a board
+    __table_args__ = (
+        Index("ix_activity_logs_board_created", board_id, created_at.desc(), id.desc()),
+        _enum_range_check("activity_type", ActivityTypeEnum),
+    )
@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for production
+
+Runs the app under UvicornWorker; with uvicorn[standard] installed the
+workers' "auto" loop and HTTP settings resolve to uvloop and httptools.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+
+# Import the app once in the master so workers share its code pages
+preload_app = True
+
+loglevel = os.getenv("LOG_LEVEL", "info")
+accesslog = "-"
+keepalive = 5
+graceful_timeout = 30
+
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master; each worker opens its own"""
+    from storage import storage
+    from async_storage import async_storage
+
+    storage.engine.dispose(close=False)
+    if async_storage.engine is not None:
+        async_storage.engine.sync_engine.dispose(close=False)
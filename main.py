@@ -1,19 +1,36 @@
 import os
+import base64
+import json
+import itertools
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Query, Path, Body
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from typing import Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime
 import uvicorn
 
 from models import (
-    BoardCreate, BoardUpdate, BoardResponse, BoardWithLists,
+    BoardCreate, BoardUpdate, BoardResponse, BoardSummaryResponse, BoardWithLists,
     ListCreate, ListUpdate, ListResponse, ListWithCards,
-    CardCreate, CardUpdate, CardResponse,
+    CardCreate, CardBulkCreate, CardUpdate, CardResponse, CardSummaryResponse,
     CommentCreate, CommentResponse,
-    ActivityLogResponse,
+    ActivityLogPage,
     PaginationParams
 )
 from storage import storage
+from async_storage import async_storage
+from middleware import CompressionMiddleware, CORSMiddleware, ETagMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the batched activity log writer and async engine for the lifetime of the app"""
+    storage.activity_writer.start()
+    yield
+    storage.activity_writer.stop()
+    await async_storage.dispose()
 
 
 app = FastAPI(
@@ -21,18 +38,108 @@ app = FastAPI(
     description="A Trello-like task management service with boards, lists, and cards",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Conditional GETs - repeat reads of unchanged resources get an empty 304
+app.add_middleware(ETagMiddleware)
+
 # CORS configuration - reads from environment variable for production
 cors_origins = os.getenv("CORS_ORIGINS", "*").split(",")
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins if cors_origins != ["*"] else ["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(CORSMiddleware, allow_origins=cors_origins)
+
+# zstd/gzip compression of responses of 1 KiB and up (outermost, so it sees final bodies)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+# Cache-Control policies: health probes may be answered by intermediaries for
+# a few seconds; resource reads are cached briefly by the client and then
+# revalidated against their ETag
+HEALTH_CACHE_CONTROL = "public, max-age=5"
+RESOURCE_CACHE_CONTROL = "private, max-age=1, must-revalidate"
+
+# Streamed array responses are flushed in chunks of about this many bytes
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Pre-built serializers for list and streamed responses. Returning encoded
+# bytes directly skips FastAPI's response_model re-validation and jsonable_encoder
+board_adapter = TypeAdapter(BoardResponse)
+card_adapter = TypeAdapter(CardResponse)
+board_with_lists_list_adapter = TypeAdapter(List[BoardWithLists])
+board_summary_list_adapter = TypeAdapter(List[BoardSummaryResponse])
+list_list_adapter = TypeAdapter(List[ListResponse])
+card_list_adapter = TypeAdapter(List[CardResponse])
+card_summary_list_adapter = TypeAdapter(List[CardSummaryResponse])
+comment_list_adapter = TypeAdapter(List[CommentResponse])
+
+
+def json_list_response(adapter: TypeAdapter, items: list) -> Response:
+    """Serialize a list of response models in one pass through pydantic-core"""
+    return Response(
+        content=adapter.dump_json(items),
+        media_type="application/json",
+        headers={"Cache-Control": RESOURCE_CACHE_CONTROL}
+    )
+
+
+def json_array_chunks(adapter: TypeAdapter, items: Iterable) -> Iterator[bytes]:
+    """Encode items as a JSON array, yielding roughly STREAM_CHUNK_SIZE bytes at a time"""
+    buffer = bytearray(b"[")
+    separator = b""
+    for item in items:
+        buffer += separator
+        buffer += adapter.dump_json(item)
+        separator = b","
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def close_stream(*iterators: Iterator):
+    """Close streamed generators, releasing their database session even when the client went away"""
+    for iterator in iterators:
+        iterator.close()
+
+
+def json_stream_response(adapter: TypeAdapter, items: Iterator) -> StreamingResponse:
+    """
+    Stream a JSON array as rows arrive from the database, so large
+    collections are never held in memory all at once
+    
+    The query runs and the first chunk is encoded before the response is
+    returned, so a database error still becomes an error status instead of
+    a truncated 200 body. `items` is closed once the response is done.
+    """
+    chunks = json_array_chunks(adapter, items)
+    try:
+        first_chunk = next(chunks)
+    except BaseException:
+        close_stream(chunks, items)
+        raise
+    return StreamingResponse(
+        itertools.chain((first_chunk,), chunks),
+        media_type="application/json",
+        headers={"Cache-Control": RESOURCE_CACHE_CONTROL},
+        background=BackgroundTask(close_stream, chunks, items)
+    )
+
+
+def encode_cursor(created_at: datetime, activity_id: str) -> str:
+    """Encode an activity log position as an opaque base64url cursor"""
+    payload = json.dumps([created_at.isoformat(), activity_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        created_at, activity_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), str(activity_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
 
 
 # ============================================
@@ -40,8 +147,9 @@ app.add_middleware(
 # ============================================
 
 @app.get("/", tags=["Health"])
-async def root():
+async def root(response: Response):
     """Health check endpoint"""
+    response.headers["Cache-Control"] = HEALTH_CACHE_CONTROL
     return {
         "service": "WorkBoard API",
         "status": "healthy",
@@ -50,8 +158,9 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(response: Response):
     """Detailed health check"""
+    response.headers["Cache-Control"] = HEALTH_CACHE_CONTROL
     return {
         "status": "healthy",
         "database": "connected"
@@ -66,36 +175,69 @@ async def health_check():
 async def create_board(board: BoardCreate):
     """Create a new board"""
     try:
-        return storage.create_board(board)
+        return await async_storage.run(storage.create_board, board)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Declared before /boards/{board_id} so "full" and "summary" are not taken for board IDs
+@app.get("/boards/summary", response_model=List[BoardSummaryResponse], tags=["Boards"])
+async def get_board_summaries_by_owner(
+    owner_id: str = Query(..., description="Owner user ID"),
+    include_archived: bool = Query(False, description="Include archived boards")
+):
+    """Get all boards owned by a user, without descriptions (lightweight listing)"""
+    return json_list_response(
+        board_summary_list_adapter,
+        await async_storage.run(storage.get_board_summaries_by_owner, owner_id, include_archived)
+    )
+
+
+@app.get("/boards/full", response_model=List[BoardWithLists], tags=["Boards"])
+async def get_boards_with_lists_by_owner(
+    owner_id: str = Query(..., description="Owner user ID"),
+    include_archived: bool = Query(False, description="Include archived boards")
+):
+    """Get all boards owned by a user, each with its lists (for dashboards)"""
+    return json_list_response(
+        board_with_lists_list_adapter,
+        await async_storage.run(storage.get_boards_with_lists_by_owner, owner_id, include_archived)
+    )
+
+
 @app.get("/boards/{board_id}", response_model=BoardResponse, tags=["Boards"])
-async def get_board(board_id: str = Path(..., description="Board ID")):
+async def get_board(
+    response: Response,
+    board_id: str = Path(..., description="Board ID")
+):
     """Get a board by ID"""
-    board = storage.get_board(board_id)
+    board = await async_storage.run(storage.get_board, board_id)
     if not board:
         raise HTTPException(status_code=404, detail=f"Board {board_id} not found")
+    response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
     return board
 
 
 @app.get("/boards/{board_id}/full", response_model=BoardWithLists, tags=["Boards"])
-async def get_board_with_lists(board_id: str = Path(..., description="Board ID")):
+async def get_board_with_lists(
+    response: Response,
+    board_id: str = Path(..., description="Board ID")
+):
     """Get a board with all its lists"""
-    board = storage.get_board_with_lists(board_id)
+    board = await async_storage.run(storage.get_board_with_lists, board_id)
     if not board:
         raise HTTPException(status_code=404, detail=f"Board {board_id} not found")
+    response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
     return board
 
 
 @app.get("/boards", response_model=List[BoardResponse], tags=["Boards"])
-async def get_boards_by_owner(
+def get_boards_by_owner(
     owner_id: str = Query(..., description="Owner user ID"),
     include_archived: bool = Query(False, description="Include archived boards")
 ):
     """Get all boards owned by a user"""
-    return storage.get_boards_by_owner(owner_id, include_archived)
+    return json_stream_response(board_adapter, storage.stream_boards_by_owner(owner_id, include_archived))
 
 
 @app.patch("/boards/{board_id}", response_model=BoardResponse, tags=["Boards"])
@@ -105,7 +247,7 @@ async def update_board(
     user_id: str = Query(..., description="User ID making the update")
 ):
     """Update a board"""
-    board = storage.update_board(board_id, board_update, user_id)
+    board = await async_storage.run(storage.update_board, board_id, board_update, user_id)
     if not board:
         raise HTTPException(status_code=404, detail=f"Board {board_id} not found")
     return board
@@ -114,7 +256,7 @@ async def update_board(
 @app.delete("/boards/{board_id}", status_code=204, tags=["Boards"])
 async def delete_board(board_id: str = Path(..., description="Board ID")):
     """Delete a board"""
-    if not storage.delete_board(board_id):
+    if not await async_storage.run(storage.delete_board, board_id):
         raise HTTPException(status_code=404, detail=f"Board {board_id} not found")
     return None
 
@@ -130,7 +272,7 @@ async def create_list(
 ):
     """Create a new list in a board"""
     try:
-        return storage.create_list(list_data, user_id)
+        return await async_storage.run(storage.create_list, list_data, user_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -138,20 +280,28 @@ async def create_list(
 
 
 @app.get("/lists/{list_id}", response_model=ListResponse, tags=["Lists"])
-async def get_list(list_id: str = Path(..., description="List ID")):
+async def get_list(
+    response: Response,
+    list_id: str = Path(..., description="List ID")
+):
     """Get a list by ID"""
-    lst = storage.get_list(list_id)
+    lst = await async_storage.run(storage.get_list, list_id)
     if not lst:
         raise HTTPException(status_code=404, detail=f"List {list_id} not found")
+    response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
     return lst
 
 
 @app.get("/lists/{list_id}/full", response_model=ListWithCards, tags=["Lists"])
-async def get_list_with_cards(list_id: str = Path(..., description="List ID")):
+async def get_list_with_cards(
+    response: Response,
+    list_id: str = Path(..., description="List ID")
+):
     """Get a list with all its cards"""
-    lst = storage.get_list_with_cards(list_id)
+    lst = await async_storage.run(storage.get_list_with_cards, list_id)
     if not lst:
         raise HTTPException(status_code=404, detail=f"List {list_id} not found")
+    response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
     return lst
 
 
@@ -161,7 +311,10 @@ async def get_lists_by_board(
     include_archived: bool = Query(False, description="Include archived lists")
 ):
     """Get all lists in a board"""
-    return storage.get_lists_by_board(board_id, include_archived)
+    return json_list_response(
+        list_list_adapter,
+        await async_storage.run(storage.get_lists_by_board, board_id, include_archived)
+    )
 
 
 @app.patch("/lists/{list_id}", response_model=ListResponse, tags=["Lists"])
@@ -171,7 +324,7 @@ async def update_list(
     user_id: str = Query(..., description="User ID making the update")
 ):
     """Update a list"""
-    lst = storage.update_list(list_id, list_update, user_id)
+    lst = await async_storage.run(storage.update_list, list_id, list_update, user_id)
     if not lst:
         raise HTTPException(status_code=404, detail=f"List {list_id} not found")
     return lst
@@ -180,7 +333,7 @@ async def update_list(
 @app.delete("/lists/{list_id}", status_code=204, tags=["Lists"])
 async def delete_list(list_id: str = Path(..., description="List ID")):
     """Delete a list"""
-    if not storage.delete_list(list_id):
+    if not await async_storage.run(storage.delete_list, list_id):
         raise HTTPException(status_code=404, detail=f"List {list_id} not found")
     return None
 
@@ -196,26 +349,55 @@ async def create_card(
 ):
     """Create a new card in a list"""
     try:
-        return storage.create_card(card_data, user_id)
+        return await async_storage.run(storage.create_card, card_data, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/lists/{list_id}/cards/bulk", response_model=List[CardResponse], status_code=201, tags=["Cards"])
+async def create_cards_bulk(
+    bulk_data: CardBulkCreate,
+    list_id: str = Path(..., description="List ID"),
+    user_id: str = Query(..., description="User ID creating the cards")
+):
+    """Create many cards in a list at once (for imports and seeding)"""
+    try:
+        cards = await async_storage.run(storage.create_cards_bulk, list_id, bulk_data.cards, user_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=card_list_adapter.dump_json(cards), status_code=201, media_type="application/json")
 
 
 @app.get("/cards/{card_id}", response_model=CardResponse, tags=["Cards"])
-async def get_card(card_id: str = Path(..., description="Card ID")):
+async def get_card(
+    response: Response,
+    card_id: str = Path(..., description="Card ID")
+):
     """Get a card by ID"""
-    card = storage.get_card(card_id)
+    card = await async_storage.run(storage.get_card, card_id)
     if not card:
         raise HTTPException(status_code=404, detail=f"Card {card_id} not found")
+    response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
     return card
 
 
 @app.get("/lists/{list_id}/cards", response_model=List[CardResponse], tags=["Cards"])
-async def get_cards_by_list(list_id: str = Path(..., description="List ID")):
+def get_cards_by_list(list_id: str = Path(..., description="List ID")):
     """Get all cards in a list"""
-    return storage.get_cards_by_list(list_id)
+    return json_stream_response(card_adapter, storage.stream_cards_by_list(list_id))
+
+
+@app.get("/lists/{list_id}/cards/summary", response_model=List[CardSummaryResponse], tags=["Cards"])
+async def get_card_summaries_by_list(list_id: str = Path(..., description="List ID")):
+    """Get all cards in a list, without descriptions (lightweight listing)"""
+    return json_list_response(
+        card_summary_list_adapter,
+        await async_storage.run(storage.get_card_summaries_by_list, list_id)
+    )
 
 
 @app.get("/cards", response_model=List[CardResponse], tags=["Cards"])
@@ -223,7 +405,10 @@ async def get_cards_by_user(
     user_id: str = Query(..., description="User ID assigned to cards")
 ):
     """Get all cards assigned to a user"""
-    return storage.get_cards_by_user(user_id)
+    return json_list_response(
+        card_list_adapter,
+        await async_storage.run(storage.get_cards_by_user, user_id)
+    )
 
 
 @app.patch("/cards/{card_id}", response_model=CardResponse, tags=["Cards"])
@@ -233,7 +418,10 @@ async def update_card(
     user_id: str = Query(..., description="User ID making the update")
 ):
     """Update a card (including moving between lists)"""
-    card = storage.update_card(card_id, card_update, user_id)
+    try:
+        card = await async_storage.run(storage.update_card, card_id, card_update, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     if not card:
         raise HTTPException(status_code=404, detail=f"Card {card_id} not found")
     return card
@@ -242,7 +430,7 @@ async def update_card(
 @app.delete("/cards/{card_id}", status_code=204, tags=["Cards"])
 async def delete_card(card_id: str = Path(..., description="Card ID")):
     """Delete a card"""
-    if not storage.delete_card(card_id):
+    if not await async_storage.run(storage.delete_card, card_id):
         raise HTTPException(status_code=404, detail=f"Card {card_id} not found")
     return None
 
@@ -255,7 +443,7 @@ async def delete_card(card_id: str = Path(..., description="Card ID")):
 async def create_comment(comment_data: CommentCreate):
     """Add a comment to a card"""
     try:
-        return storage.create_comment(comment_data)
+        return await async_storage.run(storage.create_comment, comment_data)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -265,13 +453,16 @@ async def create_comment(comment_data: CommentCreate):
 @app.get("/cards/{card_id}/comments", response_model=List[CommentResponse], tags=["Comments"])
 async def get_comments_by_card(card_id: str = Path(..., description="Card ID")):
     """Get all comments for a card"""
-    return storage.get_comments_by_card(card_id)
+    return json_list_response(
+        comment_list_adapter,
+        await async_storage.run(storage.get_comments_by_card, card_id)
+    )
 
 
 @app.delete("/comments/{comment_id}", status_code=204, tags=["Comments"])
 async def delete_comment(comment_id: str = Path(..., description="Comment ID")):
     """Delete a comment"""
-    if not storage.delete_comment(comment_id):
+    if not await async_storage.run(storage.delete_comment, comment_id):
         raise HTTPException(status_code=404, detail=f"Comment {comment_id} not found")
     return None
 
@@ -280,14 +471,24 @@ async def delete_comment(comment_id: str = Path(..., description="Comment ID")):
 # Activity Log Endpoints
 # ============================================
 
-@app.get("/boards/{board_id}/activities", response_model=List[ActivityLogResponse], tags=["Activities"])
+@app.get("/boards/{board_id}/activities", response_model=ActivityLogPage, tags=["Activities"])
 async def get_board_activities(
+    response: Response,
     board_id: str = Path(..., description="Board ID"),
     limit: int = Query(50, ge=1, le=100, description="Number of activities to return"),
-    offset: int = Query(0, ge=0, description="Number of activities to skip")
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page")
 ):
-    """Get activity log for a board"""
-    return storage.get_board_activities(board_id, limit, offset)
+    """Get activity log for a board, newest first"""
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items, next_position = await async_storage.run(storage.get_board_activities, board_id, limit, before)
+    response.headers["Cache-Control"] = RESOURCE_CACHE_CONTROL
+    return ActivityLogPage(
+        items=items,
+        next_cursor=encode_cursor(*next_position) if next_position else None
+    )
 
 
 # ============================================
@@ -297,7 +498,7 @@ async def get_board_activities(
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -306,11 +507,18 @@ async def global_exception_handler(request, exc):
     )
 
 
+# Build the OpenAPI schema once at import, after every route is registered.
+# FastAPI caches it on the app, and gunicorn's preload_app shares it with
+# every worker instead of each one walking the routes again.
+app.openapi()
+
+
 if __name__ == "__main__":
+    # Local development only; production runs gunicorn (see gunicorn.conf.py)
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Set to False in production
+        reload=os.getenv("API_RELOAD", "false").lower() == "true",
         log_level="info"
     )
@@ -0,0 +1,281 @@
+import zlib
+from typing import Optional, Sequence
+
+import xxhash
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Static part of every CORS preflight answer: any method, cached for 10 minutes
+PREFLIGHT_HEADERS = (
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+)
+
+# Supported content codings, most preferred first
+ENCODINGS_BY_PREFERENCE = ("zstd", "gzip")
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+# Headers a 304 response must repeat from the 200 it stands in for (RFC 7232)
+NOT_MODIFIED_HEADERS = (b"cache-control", b"content-location", b"date", b"expires", b"vary")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _select_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred supported coding the client accepts (q > 0)"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    for encoding in ENCODINGS_BY_PREFERENCE:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """Marks a strong ETag weak; compressed bytes are not byte-identical"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class _Compressor:
+    """Incremental zstd/gzip compressor"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._compressobj = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+            self._sync_flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            self._compressobj = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._sync_flush_mode = zlib.Z_SYNC_FLUSH
+
+    def compress(self, data: bytes, finish: bool) -> bytes:
+        """Compress a chunk; intermediate chunks are flushed so the client can decode them right away"""
+        compressed = self._compressobj.compress(data)
+        if finish:
+            return compressed + self._compressobj.flush()
+        return compressed + self._compressobj.flush(self._sync_flush_mode)
+
+
+class ETagMiddleware:
+    """
+    Tags successful GET responses with an ETag and answers 304 Not Modified
+    when the client already holds the same representation.
+    Streaming responses (more than one body chunk) pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message = {}
+        passthrough = False
+
+        async def send_with_etag(message: Message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            status = start_message["status"]
+            if message.get("more_body", False) or not 200 <= status < 300 or "etag" in headers:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            etag = f'"{xxhash.xxh3_64_hexdigest(message.get("body", b""))}"'
+            if if_none_match and _etag_matches(if_none_match, etag):
+                not_modified_headers = [
+                    (key, value) for key, value in start_message["headers"]
+                    if key.lower() in NOT_MODIFIED_HEADERS
+                ]
+                not_modified_headers.append((b"etag", etag.encode("latin-1")))
+                await send({"type": "http.response.start", "status": 304, "headers": not_modified_headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers["ETag"] = etag
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
+class CORSMiddleware:
+    """
+    Minimal CORS handling for this service's fixed policy: any method and any
+    header, with credentials, from the configured origins (or from every
+    origin when "*" is listed). Requests without an Origin header pass
+    straight through; preflights are answered here with a 204.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str]):
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        allowed = self.allow_all_origins or origin in self.allow_origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if not allowed:
+                await send({
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+                })
+                await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+                return
+            headers = [(b"access-control-allow-origin", origin), *PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        # Credentialed requests can't use "*", so the origin is always echoed
+        cors_headers = (
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        )
+
+        async def send_with_cors(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with zstd or gzip, negotiated via Accept-Encoding
+    (zstd preferred). Buffered bodies under minimum_size, 204/304 responses
+    and already-encoded bodies are sent as is; streaming bodies are
+    compressed chunk by chunk. Strong ETags become weak, since the bytes on
+    the wire now depend on the coding; 304s get the same weak ETag and Vary
+    header as the compressed 200 they revalidate.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                encoding = _select_encoding(value.decode("latin-1"))
+                break
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(scope=start_message)
+                if start_message["status"] == 304:
+                    # Repeat the validators the compressed 200 would carry so
+                    # caches keep matching it against this representation
+                    _weaken_etag(headers)
+                    headers.add_vary_header("Accept-Encoding")
+                if (
+                    start_message["status"] in (204, 304)
+                    or "content-encoding" in headers
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding)
+                body = compressor.compress(body, finish=not more_body)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                _weaken_etag(headers)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            body = compressor.compress(body, finish=not more_body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -46,8 +46,18 @@ class BoardResponse(BoardBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Board fields shown in board pickers and dashboards (no description)
+class BoardSummaryResponse(BaseModel):
+    id: str
+    name: str
+    color: Optional[str]
+    is_archived: bool
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BoardWithLists(BoardResponse):
@@ -77,8 +87,7 @@ class ListResponse(ListBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ListWithCards(ListResponse):
@@ -100,6 +109,14 @@ class CardCreate(CardBase):
     assigned_to: Optional[str] = Field(None, description="User ID assigned to this card")
 
 
+class CardBulkItem(CardBase):
+    assigned_to: Optional[str] = Field(None, description="User ID assigned to this card")
+
+
+class CardBulkCreate(BaseModel):
+    cards: List[CardBulkItem] = Field(..., min_length=1, max_length=10000, description="Cards to create, in order")
+
+
 class CardUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=2000)
@@ -109,6 +126,14 @@ class CardUpdate(BaseModel):
     due_date: Optional[datetime] = None
     assigned_to: Optional[str] = None
     list_id: Optional[str] = None  # For moving cards between lists
+    
+    # Fields backed by NOT NULL columns may be omitted, but not sent as null
+    @field_validator("title", "priority", "status", "position", "list_id")
+    @classmethod
+    def reject_null(cls, value):
+        if value is None:
+            raise ValueError("may not be null")
+        return value
 
 
 class CardResponse(CardBase):
@@ -118,8 +143,21 @@ class CardResponse(CardBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Card fields shown on a list column (no description)
+class CardSummaryResponse(BaseModel):
+    id: str
+    list_id: str
+    title: str
+    priority: CardPriority
+    status: CardStatus
+    position: int
+    due_date: Optional[datetime]
+    assigned_to: Optional[str]
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Comment Models
@@ -139,8 +177,7 @@ class CommentResponse(CommentBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Activity Log Models
@@ -167,14 +204,18 @@ class ActivityLogResponse(BaseModel):
     description: str
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActivityLogPage(BaseModel):
+    items: List[ActivityLogResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, null on the last page")
 
 
 # Pagination
 class PaginationParams(BaseModel):
     limit: int = Field(default=50, ge=1, le=100, description="Number of items to return")
-    offset: int = Field(default=0, ge=0, description="Number of items to skip")
+    cursor: Optional[str] = Field(None, description="Opaque cursor returned by the previous page")
 
 
 # Update forward references
@@ -10,7 +10,8 @@ echo "========================================="
 echo "Port: $PORT"
 echo "Database: ${DATABASE_URL:0:30}..."
 echo "CORS Origins: $CORS_ORIGINS"
+echo "Workers: ${WEB_CONCURRENCY:-auto}"
 echo "========================================="
 
-# Start uvicorn with explicit port
-exec uvicorn main:app --host 0.0.0.0 --port $PORT --log-level info
+# Start gunicorn with uvicorn workers (settings in gunicorn.conf.py)
+exec gunicorn main:app --config gunicorn.conf.py
@@ -217,12 +217,104 @@ $activities = Invoke-ApiRequest -Method "GET" -Endpoint "/boards/$BOARD_ID/activ
 
 if ($activities) {
     Write-Host ""
-    Write-Host "  Ultimas $($activities.Count) actividades:" -ForegroundColor Cyan
-    foreach ($activity in $activities) {
+    Write-Host "  Ultimas $($activities.items.Count) actividades:" -ForegroundColor Cyan
+    foreach ($activity in $activities.items) {
         Write-Host "    - $($activity.activity_type): $($activity.description)" -ForegroundColor Gray
     }
 }
 
+# TEST 9: Rechazar titulo nulo
+Write-Host ""
+Write-Host "========================================" -ForegroundColor Magenta
+Write-Host "TEST 9: Rechazar titulo nulo" -ForegroundColor Magenta
+Write-Host "========================================" -ForegroundColor Magenta
+if ($cardIds.Count -gt 0) {
+    Write-Host "[TEST] Actualizar tarjeta con title = null" -ForegroundColor Yellow
+    Write-Host "  PATCH /cards/$($cardIds[0])" -ForegroundColor Gray
+    $json = @{ title = $null } | ConvertTo-Json
+    
+    try {
+        $null = Invoke-RestMethod -Uri "$BASE_URL/cards/$($cardIds[0])?user_id=test-user-123" -Method "PATCH" -Body $json -ContentType "application/json"
+        Write-Host "  [ERROR] Se esperaba 422, la tarjeta se actualizo" -ForegroundColor Red
+    } catch {
+        $statusCode = [int]$_.Exception.Response.StatusCode
+        if ($statusCode -eq 422) {
+            Write-Host "  [OK] Rechazado con 422" -ForegroundColor Green
+        } else {
+            Write-Host "  [ERROR] Se esperaba 422, se recibio $statusCode" -ForegroundColor Red
+        }
+    }
+}
+
+# TEST 10: Crear Tarjetas en Lote
+Write-Host ""
+Write-Host "========================================" -ForegroundColor Magenta
+Write-Host "TEST 10: Crear Tarjetas en Lote" -ForegroundColor Magenta
+Write-Host "========================================" -ForegroundColor Magenta
+$bulkData = @{
+    cards = @(
+        @{ title = "Escribir documentacion"; priority = "low"; position = 0 },
+        @{ title = "Revisar codigo"; priority = "medium"; position = 1; assigned_to = "test-user-456" }
+    )
+}
+
+$bulkCards = Invoke-ApiRequest -Method "POST" -Endpoint "/lists/$($listIds[1])/cards/bulk?user_id=test-user-123" -Body $bulkData -Description "Crear 2 tarjetas en lote"
+
+if ($bulkCards) {
+    Write-Host "    Tarjetas creadas: $(@($bulkCards).Count)" -ForegroundColor Green
+}
+
+# TEST 11: Tableros Completos del Usuario
+Write-Host ""
+Write-Host "========================================" -ForegroundColor Magenta
+Write-Host "TEST 11: Tableros Completos del Usuario" -ForegroundColor Magenta
+Write-Host "========================================" -ForegroundColor Magenta
+$fullBoards = Invoke-ApiRequest -Method "GET" -Endpoint "/boards/full?owner_id=test-user-123" -Description "Obtener tableros con listas"
+
+if ($fullBoards) {
+    Write-Host "    Tableros: $(@($fullBoards).Count)" -ForegroundColor Green
+}
+
+# TEST 12: Resumen de Tableros
+Write-Host ""
+Write-Host "========================================" -ForegroundColor Magenta
+Write-Host "TEST 12: Resumen de Tableros" -ForegroundColor Magenta
+Write-Host "========================================" -ForegroundColor Magenta
+$boardSummaries = Invoke-ApiRequest -Method "GET" -Endpoint "/boards/summary?owner_id=test-user-123" -Description "Obtener resumen de tableros"
+
+if ($boardSummaries) {
+    Write-Host "    Tableros: $(@($boardSummaries).Count)" -ForegroundColor Green
+}
+
+# TEST 13: Resumen de Tarjetas
+Write-Host ""
+Write-Host "========================================" -ForegroundColor Magenta
+Write-Host "TEST 13: Resumen de Tarjetas" -ForegroundColor Magenta
+Write-Host "========================================" -ForegroundColor Magenta
+$cardSummaries = Invoke-ApiRequest -Method "GET" -Endpoint "/lists/$($listIds[1])/cards/summary" -Description "Obtener resumen de tarjetas de la lista"
+
+if ($cardSummaries) {
+    Write-Host "    Tarjetas: $(@($cardSummaries).Count)" -ForegroundColor Green
+}
+
+# TEST 14: Paginar Actividades
+Write-Host ""
+Write-Host "========================================" -ForegroundColor Magenta
+Write-Host "TEST 14: Paginar Actividades" -ForegroundColor Magenta
+Write-Host "========================================" -ForegroundColor Magenta
+$firstPage = Invoke-ApiRequest -Method "GET" -Endpoint "/boards/$BOARD_ID/activities?limit=2" -Description "Obtener primera pagina de actividades"
+
+if ($firstPage -and $firstPage.next_cursor) {
+    $cursor = [uri]::EscapeDataString($firstPage.next_cursor)
+    $secondPage = Invoke-ApiRequest -Method "GET" -Endpoint "/boards/$BOARD_ID/activities?limit=2&cursor=$cursor" -Description "Seguir next_cursor a la segunda pagina"
+    
+    if ($secondPage) {
+        Write-Host "    Actividades en la segunda pagina: $($secondPage.items.Count)" -ForegroundColor Green
+    }
+} elseif ($firstPage) {
+    Write-Host "  [ERROR] Se esperaba next_cursor en la primera pagina" -ForegroundColor Red
+}
+
 # RESUMEN FINAL
 Write-Host ""
 Write-Host ""